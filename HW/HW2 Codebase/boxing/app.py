@@ -20,6 +20,12 @@ app = Flask(__name__)
 ring_model = RingModel()
 configure_logger(app.logger)
 
+# The health check body never changes, so it is serialized once instead of on every probe
+HEALTHCHECK_BODY = app.json.dumps({
+    'status': 'success',
+    'message': 'Service is running'
+}) + "\n"
+
 
 ####################################################
 #
@@ -38,10 +44,8 @@ def healthcheck() -> Response:
 
     """
     app.logger.info("Health check endpoint hit")
-    return make_response(jsonify({
-        'status': 'success',
-        'message': 'Service is running'
-    }), 200)
+    return Response(HEALTHCHECK_BODY, status=200, mimetype='application/json',
+                    headers={'Cache-Control': 'no-store'})
 
 
 @app.route('/api/db-check', methods=['GET'])
@@ -60,7 +64,7 @@ def db_check() -> Response:
         check_database_connection()
         app.logger.info("Database connection is OK.")
     except Exception as e:
-        app.logger.error(f"Database connection failed: {e}")
+        app.logger.error("Database connection failed: %s", e)
         return make_response(jsonify({
             'status': 'error',
             'message': 'Database connection failed',
@@ -71,7 +75,7 @@ def db_check() -> Response:
         check_table_exists("boxers")
         app.logger.info("Boxer table exists.")
     except Exception as e:
-        app.logger.error(f"Failed to find boxers table: {e}")
+        app.logger.error("Failed to find boxers table: %s", e)
         return make_response(jsonify({
             'status': 'error',
             'message': 'Boxers table not found',
@@ -119,7 +123,7 @@ def add_boxer() -> Response:
         missing_fields = [field for field in required_fields if field not in data]
 
         if missing_fields:
-            app.logger.warning(f"Missing required fields: {missing_fields}")
+            app.logger.warning("Missing required fields: %s", missing_fields)
             return make_response(jsonify({
                 "status": "error",
                 "message": f"Missing required fields: {', '.join(missing_fields)}"
@@ -144,17 +148,17 @@ def add_boxer() -> Response:
                 "message": "Invalid input types: name should be a string, weight/height/reach should be numbers, age should be an integer"
             }), 400)
 
-        app.logger.info(f"Adding boxer: {name}, {weight}kg, {height}cm, {reach} inches, {age} years old")
+        app.logger.info("Adding boxer: %s, %skg, %scm, %s inches, %s years old", name, weight, height, reach, age)
         boxers_model.create_boxer(name, weight, height, reach, age)
 
-        app.logger.info(f"Boxer added successfully: {name}")
+        app.logger.info("Boxer added successfully: %s", name)
         return make_response(jsonify({
             "status": "success",
             "message": f"Boxer '{name}' added successfully"
         }), 201)
 
     except Exception as e:
-        app.logger.error(f"Failed to add boxer: {e}")
+        app.logger.error("Failed to add boxer: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while adding the boxer",
@@ -178,19 +182,19 @@ def delete_boxer(boxer_id: int) -> Response:
 
     """
     try:
-        app.logger.info(f"Received request to delete boxer with ID {boxer_id}")
+        app.logger.info("Received request to delete boxer with ID %s", boxer_id)
 
         # Check if the boxer exists before attempting to delete
         boxer = boxers_model.get_boxer_by_id(boxer_id)
         if not boxer:
-            app.logger.warning(f"Boxer with ID {boxer_id} not found.")
+            app.logger.warning("Boxer with ID %s not found.", boxer_id)
             return make_response(jsonify({
                 "status": "error",
                 "message": f"Boxer with ID {boxer_id} not found"
             }), 400)
 
         boxers_model.delete_boxer(boxer_id)
-        app.logger.info(f"Successfully deleted boxer with ID {boxer_id}")
+        app.logger.info("Successfully deleted boxer with ID %s", boxer_id)
 
         return make_response(jsonify({
             "status": "success",
@@ -198,7 +202,7 @@ def delete_boxer(boxer_id: int) -> Response:
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Failed to add boxer: {e}")
+        app.logger.error("Failed to add boxer: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while deleting the boxer",
@@ -222,25 +226,25 @@ def get_boxer_by_id(boxer_id: int) -> Response:
 
     """
     try:
-        app.logger.info(f"Received request to retrieve boxer with ID {boxer_id}")
+        app.logger.info("Received request to retrieve boxer with ID %s", boxer_id)
 
         boxer = boxers_model.get_boxer_by_id(boxer_id)
 
         if not boxer:
-            app.logger.warning(f"Boxer with ID {boxer_id} not found.")
+            app.logger.warning("Boxer with ID %s not found.", boxer_id)
             return make_response(jsonify({
                 "status": "error",
                 "message": f"Boxer with ID {boxer_id} not found"
             }), 400)
 
-        app.logger.info(f"Successfully retrieved boxer: {boxer}")
+        app.logger.info("Successfully retrieved boxer: %s", boxer)
         return make_response(jsonify({
             "status": "success",
             "boxer": boxer
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Error retrieving boxer with ID {boxer_id}: {e}")
+        app.logger.error("Error retrieving boxer with ID %s: %s", boxer_id, e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while retrieving the boxer",
@@ -264,25 +268,25 @@ def get_boxer_by_name(boxer_name: str) -> Response:
 
     """
     try:
-        app.logger.info(f"Received request to retrieve boxer with name '{boxer_name}'")
+        app.logger.info("Received request to retrieve boxer with name '%s'", boxer_name)
 
         boxer = boxers_model.get_boxer_by_name(boxer_name)
 
         if not boxer:
-            app.logger.warning(f"Boxer '{boxer_name}' not found.")
+            app.logger.warning("Boxer '%s' not found.", boxer_name)
             return make_response(jsonify({
                 "status": "error",
                 "message": f"Boxer '{boxer_name}' not found"
             }), 400)
 
-        app.logger.info(f"Successfully retrieved boxer: {boxer}")
+        app.logger.info("Successfully retrieved boxer: %s", boxer)
         return make_response(jsonify({
             "status": "success",
             "boxer": boxer
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Error retrieving boxer with name '{boxer_name}': {e}")
+        app.logger.error("Error retrieving boxer with name '%s': %s", boxer_name, e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while retrieving the boxer",
@@ -314,7 +318,7 @@ def bout() -> Response:
 
         winner = ring_model.fight()
 
-        app.logger.info(f"Fight complete. Winner: {winner}")
+        app.logger.info("Fight complete. Winner: %s", winner)
         return make_response(jsonify({
             "status": "success",
             "message": "Fight complete",
@@ -322,14 +326,14 @@ def bout() -> Response:
         }), 200)
 
     except ValueError as e:
-        app.logger.warning(f"Fight cannot be triggered: {e}")
+        app.logger.warning("Fight cannot be triggered: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": str(e)
         }), 400)
 
     except Exception as e:
-        app.logger.error(f"Error while triggering fight: {e}")
+        app.logger.error("Error while triggering fight: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while triggering the fight",
@@ -360,7 +364,7 @@ def clear_boxers() -> Response:
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Failed to clear boxers: {e}")
+        app.logger.error("Failed to clear boxers: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while clearing boxers",
@@ -394,12 +398,12 @@ def enter_ring() -> Response:
                 "message": "You must name a boxer"
             }), 400)
 
-        app.logger.info(f"Attempting to enter {boxer_name} into the ring.")
+        app.logger.info("Attempting to enter %s into the ring.", boxer_name)
 
         boxer = boxers_model.get_boxer_by_name(boxer_name)
 
         if not boxer:
-            app.logger.warning(f"Boxer '{boxer_name}' not found.")
+            app.logger.warning("Boxer '%s' not found.", boxer_name)
             return make_response(jsonify({
                 "status": "error",
                 "message": f"Boxer '{boxer_name}' not found"
@@ -408,7 +412,7 @@ def enter_ring() -> Response:
         try:
             ring_model.enter_ring(boxer)
         except ValueError as e:
-            app.logger.warning(f"Cannot enter {boxer_name}: {e}")
+            app.logger.warning("Cannot enter %s: %s", boxer_name, e)
             return make_response(jsonify({
                 "status": "error",
                 "message": str(e)
@@ -416,7 +420,7 @@ def enter_ring() -> Response:
 
         boxers = ring_model.get_boxers()
 
-        app.logger.info(f"Boxer '{boxer_name}' entered the ring. Current boxers: {boxers}")
+        app.logger.info("Boxer '%s' entered the ring. Current boxers: %s", boxer_name, boxers)
 
         return make_response(jsonify({
             "status": "success",
@@ -425,7 +429,7 @@ def enter_ring() -> Response:
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Failed to enter boxer into the ring: {e}")
+        app.logger.error("Failed to enter boxer into the ring: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while entering the boxer into the ring",
@@ -449,14 +453,14 @@ def get_boxers() -> Response:
 
         boxers = ring_model.get_boxers()
 
-        app.logger.info(f"Retrieved {len(boxers)} boxer(s).")
+        app.logger.info("Retrieved %s boxer(s).", len(boxers))
         return make_response(jsonify({
             "status": "success",
             "boxers": boxers
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Failed to retrieve boxers: {e}")
+        app.logger.error("Failed to retrieve boxers: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while retrieving boxers",
@@ -490,20 +494,20 @@ def get_leaderboard() -> Response:
         # Get the sort parameter from the query string, default to 'wins'
         sort_by = request.args.get('sort', 'wins').lower()
 
-        valid_sort_fields = {'wins', 'win_pct'}
+        valid_sort_fields = boxers_model.LEADERBOARD_SORT_FIELDS
 
         if sort_by not in valid_sort_fields:
-            app.logger.warning(f"Invalid sort parameter: '{sort_by}'")
+            app.logger.warning("Invalid sort parameter: '%s'", sort_by)
             return make_response(jsonify({
                 "status": "error",
                 "message": f"Invalid sort parameter '{sort_by}'. Must be one of: {', '.join(valid_sort_fields)}"
             }), 400)
 
-        app.logger.info(f"Generating leaderboard sorted by '{sort_by}'")
+        app.logger.info("Generating leaderboard sorted by '%s'", sort_by)
 
         leaderboard_data = boxers_model.get_leaderboard(sort_by)
 
-        app.logger.info(f"Leaderboard generated successfully. {len(leaderboard_data)} boxers ranked.")
+        app.logger.info("Leaderboard generated successfully. %s boxers ranked.", len(leaderboard_data))
 
         return make_response(jsonify({
             "status": "success",
@@ -511,7 +515,7 @@ def get_leaderboard() -> Response:
         }), 200)
 
     except Exception as e:
-        app.logger.error(f"Error generating leaderboard: {e}")
+        app.logger.error("Error generating leaderboard: %s", e)
         return make_response(jsonify({
             "status": "error",
             "message": "An internal error occurred while generating the leaderboard",
@@ -525,6 +529,6 @@ if __name__ == '__main__':
     try:
         app.run(debug=True, host='0.0.0.0', port=5000)
     except Exception as e:
-        app.logger.error(f"Flask app encountered an error: {e}")
+        app.logger.error("Flask app encountered an error: %s", e)
     finally:
         app.logger.info("Flask app has stopped.")
\ No newline at end of file
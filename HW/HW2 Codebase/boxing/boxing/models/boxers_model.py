@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import sqlite3
 from typing import Any, List
@@ -11,7 +12,8 @@ logger = logging.getLogger(__name__)
 configure_logger(logger)
 
 
-@dataclass
+# Slots keep each instance small; frozen makes boxers safe to share and hashable
+@dataclass(slots=True, frozen=True)
 class Boxer:
     id: int
     name: str
@@ -22,7 +24,7 @@ class Boxer:
     weight_class: str = None
 
     def __post_init__(self):
-        self.weight_class = get_weight_class(self.weight)  # Automatically assign weight class
+        object.__setattr__(self, 'weight_class', get_weight_class(self.weight))  # Automatically assign weight class
 
 
 def create_boxer(name: str, weight: int, height: int, reach: float, age: int) -> None:
@@ -40,11 +42,7 @@ def create_boxer(name: str, weight: int, height: int, reach: float, age: int) ->
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if the boxer already exists (name must be unique)
-            cursor.execute("SELECT 1 FROM boxers WHERE name = ?", (name,))
-            if cursor.fetchone():
-                raise ValueError(f"Boxer with name '{name}' already exists")
-
+            # Names are UNIQUE, so a duplicate surfaces as an IntegrityError from the insert
             cursor.execute("""
                 INSERT INTO boxers (name, weight, height, reach, age)
                 VALUES (?, ?, ?, ?, ?)
@@ -64,53 +62,60 @@ def delete_boxer(boxer_id: int) -> None:
         with get_db_connection() as conn:
             cursor = conn.cursor()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
+            # The row count tells us whether the boxer existed without a separate lookup
+            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
+            if cursor.rowcount == 0:
                 raise ValueError(f"Boxer with ID {boxer_id} not found.")
 
-            cursor.execute("DELETE FROM boxers WHERE id = ?", (boxer_id,))
+            cursor.execute("DELETE FROM boxers_leaderboard WHERE id = ?", (boxer_id,))
             conn.commit()
 
     except sqlite3.Error as e:
         raise e
 
 
+# boxers_leaderboard only holds boxers who have fought and is kept current by update_boxer_stats.
+# Weight class and percentage are computed by SQLite so rows map straight onto the response.
+_LB_QUERY = """
+    SELECT id, name, weight, height, reach, age,
+           CASE
+               WHEN weight >= 203 THEN 'HEAVYWEIGHT'
+               WHEN weight >= 166 THEN 'MIDDLEWEIGHT'
+               WHEN weight >= 133 THEN 'LIGHTWEIGHT'
+               WHEN weight >= 125 THEN 'FEATHERWEIGHT'
+           END AS weight_class,
+           fights, wins, ROUND(win_pct * 100, 1) AS win_pct
+    FROM boxers_leaderboard
+"""
+
+# Complete statements are built once so every call hands SQLite the same string.
+# ORDER BY names the table columns: a bare win_pct would sort by the rounded alias
+# above, losing precision and skipping the index.
+_LB_QUERY_WINS = _LB_QUERY + "ORDER BY boxers_leaderboard.wins DESC"
+_LB_QUERY_WINPCT = _LB_QUERY + "ORDER BY boxers_leaderboard.win_pct DESC"
+
+_LEADERBOARD_QUERIES = {
+    "wins": _LB_QUERY_WINS,
+    "win_pct": _LB_QUERY_WINPCT,
+}
+
+# The whitelist of sort fields is the set of prepared queries, so callers can't drift from it
+LEADERBOARD_SORT_FIELDS = tuple(_LEADERBOARD_QUERIES)
+
+
 def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
-    query = """
-        SELECT id, name, weight, height, reach, age, fights, wins,
-               (wins * 1.0 / fights) AS win_pct
-        FROM boxers
-        WHERE fights > 0
-    """
-
-    if sort_by == "win_pct":
-        query += " ORDER BY win_pct DESC"
-    elif sort_by == "wins":
-        query += " ORDER BY wins DESC"
-    else:
+    try:
+        query = _LEADERBOARD_QUERIES[sort_by]
+    except KeyError:
         raise ValueError(f"Invalid sort_by parameter: {sort_by}")
 
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute(query)
-            rows = cursor.fetchall()
-
-        leaderboard = []
-        for row in rows:
-            boxer = {
-                'id': row[0],
-                'name': row[1],
-                'weight': row[2],
-                'height': row[3],
-                'reach': row[4],
-                'age': row[5],
-                'weight_class': get_weight_class(row[2]),  # Calculate weight class
-                'fights': row[6],
-                'wins': row[7],
-                'win_pct': round(row[8] * 100, 1)  # Convert to percentage
-            }
-            leaderboard.append(boxer)
+            # sqlite3.Row maps column names to values, so dict itself is the row converter
+            leaderboard = list(map(dict, cursor.fetchall()))
 
         return leaderboard
 
@@ -120,7 +125,7 @@ def get_leaderboard(sort_by: str = "wins") -> List[dict[str, Any]]:
 
 def get_boxer_by_id(boxer_id: int) -> Boxer:
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT id, name, weight, height, reach, age
@@ -144,7 +149,7 @@ def get_boxer_by_id(boxer_id: int) -> Boxer:
 
 def get_boxer_by_name(boxer_name: str) -> Boxer:
     try:
-        with get_db_connection() as conn:
+        with get_db_connection(readonly=True) as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT id, name, weight, height, reach, age
@@ -166,6 +171,8 @@ def get_boxer_by_name(boxer_name: str) -> Boxer:
         raise e
 
 
+# Pure function of the weight and called for every Boxer, so results are memoized
+@lru_cache(maxsize=256)
 def get_weight_class(weight: int) -> str:
     if weight >= 203:
         weight_class = 'HEAVYWEIGHT'
@@ -176,11 +183,34 @@ def get_weight_class(weight: int) -> str:
     elif weight >= 125:
         weight_class = 'FEATHERWEIGHT'
     else:
-        raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
+        _raise_invalid_weight(weight)
 
     return weight_class
 
 
+def _raise_invalid_weight(weight: int) -> None:
+    # Exceptions are not cached, so invalid weights are re-checked on every call
+    raise ValueError(f"Invalid weight: {weight}. Weight must be at least 125.")
+
+
+def _record_result(cursor: sqlite3.Cursor, boxer_id: int, result: str) -> None:
+    if result == 'win':
+        cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
+    else:  # result == 'loss'
+        cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
+
+    # The row count tells us whether the boxer existed without a separate lookup
+    if cursor.rowcount == 0:
+        raise ValueError(f"Boxer with ID {boxer_id} not found.")
+
+    # Refresh the boxer's leaderboard row in the same transaction
+    cursor.execute("""
+        INSERT OR REPLACE INTO boxers_leaderboard (id, name, weight, height, reach, age, fights, wins, win_pct)
+        SELECT id, name, weight, height, reach, age, fights, wins, wins * 1.0 / fights
+        FROM boxers WHERE id = ?
+    """, (boxer_id,))
+
+
 def update_boxer_stats(boxer_id: int, result: str) -> None:
     if result not in {'win', 'loss'}:
         raise ValueError(f"Invalid result: {result}. Expected 'win' or 'loss'.")
@@ -188,16 +218,30 @@ def update_boxer_stats(boxer_id: int, result: str) -> None:
     try:
         with get_db_connection() as conn:
             cursor = conn.cursor()
+            try:
+                _record_result(cursor, boxer_id, result)
+            except ValueError:
+                conn.rollback()
+                raise
+            conn.commit()
 
-            cursor.execute("SELECT id FROM boxers WHERE id = ?", (boxer_id,))
-            if cursor.fetchone() is None:
-                raise ValueError(f"Boxer with ID {boxer_id} not found.")
+    except sqlite3.Error as e:
+        raise e
 
-            if result == 'win':
-                cursor.execute("UPDATE boxers SET fights = fights + 1, wins = wins + 1 WHERE id = ?", (boxer_id,))
-            else:  # result == 'loss'
-                cursor.execute("UPDATE boxers SET fights = fights + 1 WHERE id = ?", (boxer_id,))
 
+def update_boxer_stats_pair(winner_id: int, loser_id: int) -> None:
+    # Both results of a fight share one transaction, so a fight costs a single commit
+    # and a missing boxer leaves neither record changed
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                _record_result(cursor, winner_id, 'win')
+                _record_result(cursor, loser_id, 'loss')
+            except ValueError:
+                # Undo the winner's update rather than leave it pending on the connection
+                conn.rollback()
+                raise
             conn.commit()
 
     except sqlite3.Error as e:
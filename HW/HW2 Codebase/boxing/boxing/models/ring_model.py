@@ -1,8 +1,8 @@
 import logging
-import math
+from math import exp
 from typing import List
 
-from boxing.models.boxers_model import Boxer, update_boxer_stats
+from boxing.models.boxers_model import Boxer, update_boxer_stats_pair
 from boxing.utils.logger import configure_logger
 from boxing.utils.api_utils import get_random
 
@@ -27,7 +27,7 @@ class RingModel:
         # Compute the absolute skill difference
         # And normalize using a logistic function for better probability scaling
         delta = abs(skill_1 - skill_2)
-        normalized_delta = 1 / (1 + math.e ** (-delta))
+        normalized_delta = 1.0 / (1.0 + exp(-delta))
 
         random_number = get_random()
 
@@ -38,8 +38,7 @@ class RingModel:
             winner = boxer_2
             loser = boxer_1
 
-        update_boxer_stats(winner.id, 'win')
-        update_boxer_stats(loser.id, 'loss')
+        update_boxer_stats_pair(winner.id, loser.id)
 
         self.clear_ring()
 
@@ -69,7 +68,8 @@ class RingModel:
 
     def get_fighting_skill(self, boxer: Boxer) -> float:
         # Arbitrary calculations
-        age_modifier = -1 if boxer.age < 25 else (-2 if boxer.age > 35 else 0)
+        # -1 under 25, -2 over 35, 0 otherwise; the comparisons are used as 0/1 instead of branching
+        age_modifier = -(boxer.age < 25) - 2 * (boxer.age > 35)
         skill = (boxer.weight * len(boxer.name)) + (boxer.reach / 10) + age_modifier
 
         return skill
@@ -1,6 +1,13 @@
 import logging
 import os
+import queue
+import random
+import threading
+import time
+from typing import List
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from boxing.utils.logger import configure_logger
 
@@ -10,27 +17,143 @@ configure_logger(logger)
 
 
 RANDOM_ORG_URL = os.getenv("RANDOM_ORG_URL",
-                           "https://www.random.org/decimal-fractions/?num=1&dec=2&col=1&format=plain&rnd=new")
+                           "https://www.random.org/decimal-fractions/?num=64&dec=2&col=1&format=plain&rnd=new")
 
+# Fights draw from the local generator unless random.org is explicitly requested,
+# which keeps a network round trip off every fight
+USE_REMOTE_RNG = os.getenv("USE_REMOTE_RNG") == "1"
 
-def get_random() -> float:
+# Buffered random.org numbers are refetched once the buffer drops to this level,
+# and the buffer has room for a full batch of 64 on top of it
+RNG_LOW_WATER = 16
+RNG_BUFFER_SIZE = 128
+
+# Seconds to wait on random.org, or on the buffer while it is being refilled
+RNG_TIMEOUT = 5
+
+# After a failed fetch, seconds before the next refill may be tried, doubling up to the cap
+RNG_RETRY_BACKOFF = 1
+RNG_RETRY_MAX = 30
+
+# How often a waiting caller checks whether the refill has failed
+RNG_POLL_INTERVAL = 0.05
+
+# Reuse one session so every fight after the first skips the TCP and TLS handshake with random.org
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def _fetch_batch() -> List[float]:
     try:
-        response = requests.get(RANDOM_ORG_URL, timeout=5)
+        response = _session.get(RANDOM_ORG_URL, timeout=RNG_TIMEOUT)
 
         # Check if the request was successful
         response.raise_for_status()
 
-        random_number_str = response.text.strip()
+        # One number per line, as many as the URL's num parameter asks for
+        random_number_strs = response.text.split()
 
         try:
-            random_number = float(random_number_str)
+            random_numbers = [float(random_number_str) for random_number_str in random_number_strs]
         except ValueError:
-            raise ValueError(f"Invalid response from random.org: {random_number_str}")
+            raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
 
-        return random_number
+        if not random_numbers:
+            raise ValueError(f"Invalid response from random.org: {response.text.strip()}")
+
+        return random_numbers
 
     except requests.exceptions.Timeout:
         raise RuntimeError("Request to random.org timed out.")
 
     except requests.exceptions.RequestException as e:
         raise RuntimeError(f"Request to random.org failed: {e}")
+
+
+class RandomBuffer:
+    """Random.org numbers prefetched in batches by a background thread.
+
+    Fights take a number from the queue, so the HTTP round trip only happens when the
+    buffer runs low, and then off the request thread.
+
+    """
+
+    def __init__(self, low_water: int = RNG_LOW_WATER, maxsize: int = RNG_BUFFER_SIZE):
+        self.low_water = low_water
+        self._numbers = queue.Queue(maxsize=maxsize)
+        self._refill = threading.Event()
+        self._error = None
+        self._refilling = False
+        self._retry_at = 0.0
+        self._backoff = RNG_RETRY_BACKOFF
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _run(self):
+        while True:
+            self._refill.wait()
+            self._refill.clear()
+
+            try:
+                random_numbers = _fetch_batch()
+            except (RuntimeError, ValueError) as e:
+                logger.error("Failed to prefetch random numbers: %s", e)
+                # Back off so a random.org outage isn't hit by every fight
+                self._retry_at = time.monotonic() + self._backoff
+                self._backoff = min(self._backoff * 2, RNG_RETRY_MAX)
+                self._error = e
+                self._refilling = False
+                continue
+
+            self._error = None
+            self._backoff = RNG_RETRY_BACKOFF
+            for random_number in random_numbers:
+                # Blocks if a large batch overfills the buffer, until fights drain it
+                self._numbers.put(random_number)
+            self._refilling = False
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="random-org-prefetch", daemon=True)
+                self._thread.start()
+
+    def get(self) -> float:
+        if self._thread is None:
+            self._start()
+
+        # Only one refill is requested at a time, and none until the backoff has passed
+        if (not self._refilling and self._numbers.qsize() <= self.low_water
+                and time.monotonic() >= self._retry_at):
+            self._refilling = True
+            self._refill.set()
+
+        # Fail straight away when the last fetch failed and nothing is buffered
+        self._raise_error()
+
+        deadline = time.monotonic() + RNG_TIMEOUT
+        while True:
+            try:
+                return self._numbers.get(timeout=RNG_POLL_INTERVAL)
+            except queue.Empty:
+                # Stop waiting as soon as the background fetch reports a failure
+                self._raise_error()
+                if time.monotonic() >= deadline:
+                    raise RuntimeError("Request to random.org timed out.")
+
+    def _raise_error(self):
+        error = self._error
+        if error is not None and self._numbers.empty():
+            # Surface the fetch failure from the background thread to the caller,
+            # chained so its original traceback is kept
+            raise RuntimeError(str(error)) from error
+
+
+_buffer = RandomBuffer()
+
+
+def get_random() -> float:
+    if not USE_REMOTE_RNG:
+        return random.random()
+
+    return _buffer.get()
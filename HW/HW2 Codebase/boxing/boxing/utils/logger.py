@@ -1,27 +1,35 @@
 import logging
 import sys
+import weakref
 
 from flask import current_app, has_request_context
 
 
+# Loggers that already have our stderr handler, so repeat calls don't stack duplicates
+_configured = weakref.WeakSet()
+
+
 def configure_logger(logger):
     logger.setLevel(logging.DEBUG)
 
-    # Create a console handler that logs to stderr
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setLevel(logging.DEBUG)
+    if logger not in _configured:
+        # Create a console handler that logs to stderr
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setLevel(logging.DEBUG)
 
-    # Create a formatter with a timestamp
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        # Create a formatter with a timestamp
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-    # Add the formatter to the handler
-    handler.setFormatter(formatter)
+        # Add the formatter to the handler
+        handler.setFormatter(formatter)
 
-    # Add the handler to the logger
-    logger.addHandler(handler)
+        # Add the handler to the logger
+        logger.addHandler(handler)
+        _configured.add(logger)
 
     # We also need to add the handler to the Flask logger
     if has_request_context():
         app_logger = current_app.logger
         for handler in app_logger.handlers:
-            logger.addHandler(handler)
\ No newline at end of file
+            if handler not in logger.handlers:
+                logger.addHandler(handler)
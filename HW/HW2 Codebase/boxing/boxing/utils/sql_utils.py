@@ -1,7 +1,11 @@
-from contextlib import contextmanager
+import atexit
+from contextlib import contextmanager, suppress
 import logging
 import os
+import queue
 import sqlite3
+import threading
+from typing import Optional
 
 from boxing.utils.logger import configure_logger
 
@@ -13,6 +17,15 @@ configure_logger(logger)
 # load the db path from the environment with a default value
 DB_PATH = os.getenv("DB_PATH", "/app/sql/boxing.db")
 
+# Seconds to wait on a locked database or a free pooled connection before giving up
+DB_TIMEOUT = 5.0
+
+# Compiled statements each connection keeps (sqlite3 defaults to 128)
+DB_CACHED_STATEMENTS = 256
+
+# Number of read connections kept open per database
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+
 
 def check_database_connection():
     try:
@@ -47,14 +60,170 @@ def check_table_exists(tablename: str):
         error_message = f"Table check error for '{tablename}': {e}"
         raise Exception(error_message) from e
 
+def _enable_wal(conn: sqlite3.Connection):
+    # WAL lets readers keep going while a writer commits
+    conn.execute("PRAGMA journal_mode=WAL")
+
+# Indexes and the leaderboard table from init_db.sql, for databases created before they existed.
+# Every statement is idempotent, so running this against an up-to-date database is a no-op.
+# The DDL must stay identical to init_db.sql; test_sql_utils compares the two schemas.
+_SCHEMA_BOOTSTRAP = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_boxers_name ON boxers(name)",
+    """
+    CREATE TABLE IF NOT EXISTS boxers_leaderboard (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        weight REAL NOT NULL,
+        height REAL NOT NULL,
+        reach REAL,
+        age INTEGER NOT NULL,
+        fights INTEGER NOT NULL CHECK (fights > 0),
+        wins INTEGER NOT NULL,
+        win_pct REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_boxers_leaderboard_wins ON boxers_leaderboard(wins DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_boxers_leaderboard_win_pct ON boxers_leaderboard(win_pct DESC)",
+    # Backfill boxers who fought before the leaderboard table was added
+    """
+    INSERT OR IGNORE INTO boxers_leaderboard (id, name, weight, height, reach, age, fights, wins, win_pct)
+    SELECT id, name, weight, height, reach, age, fights, wins, wins * 1.0 / fights
+    FROM boxers WHERE fights > 0
+    """,
+)
+
+
+def _bootstrap_schema(conn: sqlite3.Connection):
+    # Runs once, when a pool opens its writer. A database without a boxers table is skipped
+    # and not checked again until the pool is reopened (a restart or close_all); init_db.sql
+    # creates the leaderboard table itself, so only older schemas depend on this.
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='boxers';")
+    if cursor.fetchone() is None:
+        # Nothing to index yet; the db-check route reports the missing table
+        logger.warning("Skipping schema bootstrap: table 'boxers' does not exist.")
+        return
+
+    for statement in _SCHEMA_BOOTSTRAP:
+        cursor.execute(statement)
+    conn.commit()
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    # The timeout installs SQLite's busy handler, so writers wait on a lock instead of failing.
+    # Pooled connections are handed between Flask threads, but only one thread uses each at a time.
+    # Connections live as long as the pool, so a larger statement cache keeps every query prepared.
+    conn = sqlite3.connect(
+        db_path, timeout=DB_TIMEOUT, check_same_thread=False, cached_statements=DB_CACHED_STATEMENTS
+    )
+
+    # These pragmas are per connection, so they are paid once when the pool opens it
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    return conn
+
+
+class ConnectionPool:
+    """Long-lived connections to one database: a single writer and a queue of readers.
+
+    SQLite allows only one writer at a time, so the writer connection is guarded by a lock
+    while readers are checked out of the queue and run concurrently under WAL.
+
+    """
+
+    def __init__(self, db_path: str, size: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self._write_lock = threading.Lock()
+        self._readers = queue.Queue(maxsize=size)
+        self._writer = _connect(db_path)
+
+        try:
+            _enable_wal(self._writer)
+            _bootstrap_schema(self._writer)
+
+            for _ in range(size):
+                self._readers.put(_connect(db_path))
+        except BaseException:
+            # Don't leak the connections opened so far when the pool can't be built
+            self.close()
+            raise
+
+    def _reset(self, conn: sqlite3.Connection) -> Optional[sqlite3.Connection]:
+        # Discard anything left uncommitted, as closing the connection used to
+        try:
+            conn.rollback()
+            return conn
+        except sqlite3.Error:
+            # Leave the slot empty, so a fresh connection is opened on its next checkout
+            with suppress(sqlite3.Error):
+                conn.close()
+            return None
+
+    @contextmanager
+    def reader(self):
+        try:
+            conn = self._readers.get(timeout=DB_TIMEOUT)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a database connection")
+        try:
+            if conn is None:
+                conn = _connect(self.db_path)
+            yield conn
+        finally:
+            # The slot always goes back, even empty, so the pool never shrinks
+            self._readers.put(None if conn is None else self._reset(conn))
+
+    @contextmanager
+    def writer(self):
+        if not self._write_lock.acquire(timeout=DB_TIMEOUT):
+            raise sqlite3.OperationalError("Timed out waiting for the database writer")
+        try:
+            if self._writer is None:
+                self._writer = _connect(self.db_path)
+            yield self._writer
+        finally:
+            try:
+                if self._writer is not None:
+                    self._writer = self._reset(self._writer)
+            finally:
+                self._write_lock.release()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                break
+            if conn is not None:
+                conn.close()
+
+
+# One pool per database path, opened on first use so importing this module never touches the file
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    pool = _pools.get(DB_PATH)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(DB_PATH)
+            if pool is None:
+                pool = _pools[DB_PATH] = ConnectionPool(DB_PATH)
+    return pool
+
+def close_all():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+atexit.register(close_all)
+
 @contextmanager
-def get_db_connection():
-    conn = None
-    try:
-        conn = sqlite3.connect(DB_PATH)
+def get_db_connection(readonly: bool = False):
+    pool = _get_pool()
+    with (pool.reader() if readonly else pool.writer()) as conn:
         yield conn
-    except sqlite3.Error as e:
-        raise e
-    finally:
-        if conn:
-            conn.close()
@@ -13,5 +13,6 @@ else
     echo "Skipping database creation."
 fi
 
-# Start the Python application
-exec python app.py
+# Start the application under gunicorn instead of Flask's development server.
+# A single worker keeps the in-memory ring shared by every request; threads serve requests concurrently.
+exec gunicorn --bind 0.0.0.0:5000 --workers 1 --threads "${GUNICORN_THREADS:-8}" app:app
@@ -1,3 +1,4 @@
+DROP TABLE IF EXISTS boxers_leaderboard;
 DROP TABLE IF EXISTS boxers;
 CREATE TABLE boxers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -11,3 +12,20 @@ CREATE TABLE boxers (
 );
 
 CREATE UNIQUE INDEX idx_boxers_name ON boxers(name);
+
+-- Quasi-materialized view of boxers who have fought, kept current by update_boxer_stats
+-- so the leaderboard is read in index order instead of computed and sorted per request
+CREATE TABLE boxers_leaderboard (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    weight REAL NOT NULL,
+    height REAL NOT NULL,
+    reach REAL,
+    age INTEGER NOT NULL,
+    fights INTEGER NOT NULL CHECK (fights > 0),
+    wins INTEGER NOT NULL,
+    win_pct REAL NOT NULL
+);
+
+CREATE INDEX idx_boxers_leaderboard_wins ON boxers_leaderboard(wins DESC);
+CREATE INDEX idx_boxers_leaderboard_win_pct ON boxers_leaderboard(win_pct DESC);
@@ -0,0 +1,133 @@
+import time
+
+import pytest
+import requests
+
+from boxing.utils import api_utils
+from boxing.utils.api_utils import RANDOM_ORG_URL, RandomBuffer, _fetch_batch, _session, get_random
+
+
+RANDOM_NUMBERS = [0.42, 0.17, 0.93]
+
+
+@pytest.fixture
+def remote_rng(monkeypatch):
+    """Route get_random through a fresh random.org buffer for the test."""
+    # With a low-water mark of 0 the buffer only refills when empty,
+    # so no background fetch is left running once the test's numbers are drawn
+    monkeypatch.setattr(api_utils, "USE_REMOTE_RNG", True)
+    monkeypatch.setattr(api_utils, "_buffer", RandomBuffer(low_water=0))
+
+@pytest.fixture
+def mock_random_org(mocker):
+    # Patch the shared session's get call
+    # _session.get returns an object, which we have replaced with a mock object
+    mock_response = mocker.Mock()
+    # We are giving that object a text attribute, one number per line like random.org
+    mock_response.text = "\n".join(str(number) for number in RANDOM_NUMBERS) + "\n"
+    mocker.patch("boxing.utils.api_utils._session.get", return_value=mock_response)
+    return mock_response
+
+def test_get_random_local(mocker, monkeypatch):
+    """Test that random numbers come from the local generator by default.
+
+    """
+    # Pin the flag so a USE_REMOTE_RNG=1 environment doesn't route the call to random.org
+    monkeypatch.setattr(api_utils, "USE_REMOTE_RNG", False)
+    mock_get = mocker.patch("boxing.utils.api_utils._session.get")
+    mocker.patch("boxing.utils.api_utils.random.random", return_value=RANDOM_NUMBERS[0])
+
+    assert get_random() == RANDOM_NUMBERS[0]
+    mock_get.assert_not_called()
+
+def test_fetch_batch(mock_random_org):
+    """Test retrieving a batch of random numbers from random.org.
+
+    """
+    result = _fetch_batch()
+
+    # Assert that the result is the mocked batch
+    assert result == RANDOM_NUMBERS, f"Expected random numbers {RANDOM_NUMBERS}, but got {result}"
+
+    # Ensure that the correct URL was called through the shared session
+    _session.get.assert_called_once_with(RANDOM_ORG_URL, timeout=5)
+
+def test_fetch_batch_request_failure(mocker):
+    """Test handling of a request failure when calling random.org.
+
+    """
+    # Simulate a request failure
+    mocker.patch("boxing.utils.api_utils._session.get", side_effect=requests.exceptions.RequestException("Connection error"))
+
+    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
+        _fetch_batch()
+
+def test_fetch_batch_timeout(mocker):
+    """Test handling of a timeout when calling random.org.
+
+    """
+    # Simulate a timeout
+    mocker.patch("boxing.utils.api_utils._session.get", side_effect=requests.exceptions.Timeout)
+
+    with pytest.raises(RuntimeError, match="Request to random.org timed out."):
+        _fetch_batch()
+
+@pytest.mark.parametrize("text", ["invalid_response", ""])
+def test_fetch_batch_invalid_response(mock_random_org, text):
+    """Test handling of an invalid or empty response from random.org.
+
+    """
+    mock_random_org.text = text
+
+    with pytest.raises(ValueError, match=f"Invalid response from random.org: {text}"):
+        _fetch_batch()
+
+def test_get_random_remote(remote_rng, mock_random_org):
+    """Test that remote numbers are served from one prefetched batch.
+
+    """
+    results = [get_random() for _ in RANDOM_NUMBERS]
+
+    assert results == RANDOM_NUMBERS, f"Expected random numbers {RANDOM_NUMBERS}, but got {results}"
+
+    # One request to random.org served every fight; draws made while the batch is still
+    # being queued don't request another refill
+    _session.get.assert_called_once_with(RANDOM_ORG_URL, timeout=5)
+
+def test_get_random_remote_failure(remote_rng, mocker):
+    """Test that a failed prefetch is reported to the caller without waiting out the timeout.
+
+    """
+    mocker.patch(
+        "boxing.utils.api_utils._session.get", side_effect=requests.exceptions.RequestException("Connection error")
+    )
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error") as excinfo:
+        get_random()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < api_utils.RNG_TIMEOUT / 2, f"Expected the failure to be raised at once, took {elapsed:.2f}s"
+
+    # The caller's error is chained to the one raised in the prefetch thread
+    assert excinfo.value.__cause__ is api_utils._buffer._error
+    assert excinfo.value.__cause__.__traceback__ is not None
+
+def test_get_random_remote_failure_backoff(remote_rng, mocker):
+    """Test that callers after a failed prefetch fail at once and don't refetch during the backoff.
+
+    """
+    mock_get = mocker.patch(
+        "boxing.utils.api_utils._session.get", side_effect=requests.exceptions.RequestException("Connection error")
+    )
+
+    with pytest.raises(RuntimeError):
+        get_random()
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="Request to random.org failed: Connection error"):
+        get_random()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < api_utils.RNG_POLL_INTERVAL, f"Expected the stored failure to be raised at once, took {elapsed:.2f}s"
+    assert mock_get.call_count == 1, "Expected no retry before the backoff has passed"
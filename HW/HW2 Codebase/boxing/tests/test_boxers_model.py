@@ -0,0 +1,408 @@
+from contextlib import nullcontext
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+import re
+import sqlite3
+
+import pytest
+
+from boxing.models.boxers_model import (
+    LEADERBOARD_SORT_FIELDS,
+    _LEADERBOARD_QUERIES,
+    Boxer,
+    create_boxer,
+    delete_boxer,
+    get_boxer_by_id,
+    get_boxer_by_name,
+    get_leaderboard,
+    get_weight_class,
+    update_boxer_stats,
+    update_boxer_stats_pair
+)
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+
+# Shared by the lookup and delete tests, so it is compiled once rather than per pytest.raises call
+MISSING_BOXER_ID = re.compile(r"Boxer with ID 999 not found\.")
+
+
+def normalize_whitespace(sql_query: str) -> str:
+    return re.sub(r'\s+', ' ', sql_query).strip()
+
+# Mocking the database connection for tests
+@pytest.fixture
+def mock_cursor(mocker, monkeypatch):
+    mock_conn = mocker.Mock()
+    mock_cursor = mocker.Mock()
+
+    # Mock the connection's cursor
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchone.return_value = None  # Default return for queries
+    mock_cursor.fetchall.return_value = []
+    mock_cursor.rowcount = 0  # Default for writes that match no rows
+    mock_conn.commit.return_value = None
+    mock_cursor.connection = mock_conn  # Mirrors sqlite3.Cursor.connection so tests can check commits
+
+    # Stand in for the get_db_connection context manager from sql_utils with a plain
+    # attribute swap; nullcontext just hands back the mocked connection
+    monkeypatch.setattr(
+        "boxing.models.boxers_model.get_db_connection", lambda readonly=False: nullcontext(mock_conn)
+    )
+
+    return mock_cursor  # Return the mock cursor so we can set expectations per test
+
+
+def executed_queries(mock_cursor) -> list[str]:
+    return [normalize_whitespace(call[0][0]) for call in mock_cursor.execute.call_args_list]
+
+
+SCHEMA_PATH = Path(__file__).resolve().parents[1] / "sql" / "init_db.sql"
+
+@pytest.fixture(scope="module")
+def memory_db():
+    """In-memory database with the real schema, opened once for the module."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA_PATH.read_text())
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def db(monkeypatch, memory_db):
+    """Route get_db_connection to the in-memory database and empty it after the test."""
+    monkeypatch.setattr(
+        "boxing.models.boxers_model.get_db_connection", lambda readonly=False: nullcontext(memory_db)
+    )
+    yield memory_db
+
+    # Like a pooled connection being released, drop anything left uncommitted first
+    memory_db.rollback()
+    memory_db.executescript("""
+        DELETE FROM boxers_leaderboard;
+        DELETE FROM boxers;
+        DELETE FROM sqlite_sequence;
+    """)
+
+
+######################################################
+#
+#    Add and delete
+#
+######################################################
+
+
+def test_create_boxer(mock_cursor):
+    """Test creating a new boxer.
+
+    """
+    create_boxer(name="Ali", weight=180, height=70, reach=72.5, age=28)
+
+    expected_query = normalize_whitespace("""
+        INSERT INTO boxers (name, weight, height, reach, age)
+        VALUES (?, ?, ?, ?, ?)
+    """)
+    assert executed_queries(mock_cursor) == [expected_query], "Expected the insert to be the only statement."
+
+    actual_arguments = mock_cursor.execute.call_args[0][1]
+    expected_arguments = ("Ali", 180, 70, 72.5, 28)
+
+    assert actual_arguments == expected_arguments, f"The SQL query arguments did not match. Expected {expected_arguments}, got {actual_arguments}."
+
+
+def test_create_boxer_duplicate(mock_cursor):
+    """Test creating a boxer whose name is already taken.
+
+    """
+    mock_cursor.execute.side_effect = sqlite3.IntegrityError("UNIQUE constraint failed: boxers.name")
+
+    with pytest.raises(ValueError, match="Boxer with name 'Ali' already exists"):
+        create_boxer(name="Ali", weight=180, height=70, reach=72.5, age=28)
+
+
+@pytest.mark.parametrize("fields, message", [
+    ({"weight": 124}, "Invalid weight: 124. Must be at least 125."),
+    ({"height": 0}, "Invalid height: 0. Must be greater than 0."),
+    ({"reach": -1}, "Invalid reach: -1. Must be greater than 0."),
+    ({"age": 41}, "Invalid age: 41. Must be between 18 and 40."),
+])
+def test_create_boxer_invalid(fields, message):
+    """Test that out-of-range attributes are rejected before touching the database.
+
+    """
+    boxer = {"name": "Ali", "weight": 180, "height": 70, "reach": 72.5, "age": 28, **fields}
+
+    with pytest.raises(ValueError, match=re.escape(message)):
+        create_boxer(**boxer)
+
+
+def test_delete_boxer(mock_cursor):
+    """Test deleting a boxer removes them from the boxers and leaderboard tables.
+
+    """
+    mock_cursor.rowcount = 1
+
+    delete_boxer(1)
+
+    assert executed_queries(mock_cursor) == [
+        "DELETE FROM boxers WHERE id = ?",
+        "DELETE FROM boxers_leaderboard WHERE id = ?",
+    ], "Expected the boxer to be deleted from both tables."
+
+
+def test_delete_boxer_not_found(mock_cursor):
+    """Test deleting a boxer that does not exist.
+
+    """
+    with pytest.raises(ValueError, match=MISSING_BOXER_ID):
+        delete_boxer(999)
+
+    assert executed_queries(mock_cursor) == ["DELETE FROM boxers WHERE id = ?"]
+
+
+######################################################
+#
+#    Get boxers
+#
+######################################################
+
+
+def test_get_boxer_by_id(mock_cursor):
+    """Test retrieving a boxer by ID.
+
+    """
+    mock_cursor.fetchone.return_value = (1, "Ali", 180, 70, 72.5, 28)
+
+    result = get_boxer_by_id(1)
+
+    assert result == Boxer(1, "Ali", 180, 70, 72.5, 28), f"Unexpected boxer: {result}"
+    assert result.weight_class == "MIDDLEWEIGHT"
+
+
+def test_boxer_is_frozen():
+    """Test that boxers are immutable, slotted and hashable.
+
+    """
+    boxer = Boxer(1, "Ali", 180, 70, 72.5, 28)
+
+    with pytest.raises(FrozenInstanceError):
+        boxer.name = "Tyson"
+
+    assert not hasattr(boxer, "__dict__"), "Expected Boxer to use __slots__"
+    assert {boxer, Boxer(1, "Ali", 180, 70, 72.5, 28)} == {boxer}
+
+
+def test_get_boxer_by_id_not_found(mock_cursor):
+    """Test retrieving a boxer by an ID that does not exist.
+
+    """
+    with pytest.raises(ValueError, match=MISSING_BOXER_ID):
+        get_boxer_by_id(999)
+
+
+def test_get_boxer_by_name(mock_cursor):
+    """Test retrieving a boxer by name.
+
+    """
+    mock_cursor.fetchone.return_value = (1, "Ali", 180, 70, 72.5, 28)
+
+    result = get_boxer_by_name("Ali")
+
+    assert result == Boxer(1, "Ali", 180, 70, 72.5, 28), f"Unexpected boxer: {result}"
+    assert mock_cursor.execute.call_args[0][1] == ("Ali",)
+
+
+def test_get_boxer_by_name_not_found(mock_cursor):
+    """Test retrieving a boxer by a name that does not exist.
+
+    """
+    with pytest.raises(ValueError, match="Boxer 'Nobody' not found."):
+        get_boxer_by_name("Nobody")
+
+
+@pytest.mark.parametrize("weight, expected", [
+    (125, "FEATHERWEIGHT"),
+    (133, "LIGHTWEIGHT"),
+    (166, "MIDDLEWEIGHT"),
+    (203, "HEAVYWEIGHT"),
+])
+def test_get_weight_class(weight, expected):
+    """Test the weight class boundaries.
+
+    """
+    assert get_weight_class(weight) == expected
+
+
+def test_get_weight_class_invalid():
+    """Test that weights below the lightest class are rejected.
+
+    """
+    with pytest.raises(ValueError, match="Invalid weight: 124. Weight must be at least 125."):
+        get_weight_class(124)
+
+
+def test_get_weight_class_cached():
+    """Test that repeated lookups for the same weight are served from the cache.
+
+    """
+    get_weight_class.cache_clear()
+
+    get_weight_class(180)
+    get_weight_class(180)
+
+    info = get_weight_class.cache_info()
+    assert (info.hits, info.misses) == (1, 1), f"Expected one miss then one hit, got {info}"
+
+
+######################################################
+#
+#    Leaderboard
+#
+######################################################
+
+
+def test_leaderboard_sort_fields():
+    """Test that the public whitelist matches the supported sort orders.
+
+    """
+    assert LEADERBOARD_SORT_FIELDS == ("wins", "win_pct")
+
+
+@pytest.mark.parametrize("sort_by, order_by", [("wins", "wins"), ("win_pct", "win_pct")])
+def test_get_leaderboard(mock_cursor, sort_by, order_by):
+    """Test that the leaderboard is read from the precomputed table in the requested order.
+
+    """
+    # Rows come back keyed by column name via sqlite3.Row
+    ali = {
+        'id': 1, 'name': "Ali", 'weight': 180, 'height': 70, 'reach': 72.5, 'age': 28,
+        'weight_class': "MIDDLEWEIGHT", 'fights': 4, 'wins': 3, 'win_pct': 75.0
+    }
+    mock_cursor.fetchall.return_value = [ali]
+
+    leaderboard = get_leaderboard(sort_by)
+
+    actual_query = normalize_whitespace(mock_cursor.execute.call_args[0][0])
+    assert actual_query.startswith("SELECT id, name, weight, height, reach, age, CASE")
+    assert actual_query.endswith(
+        f"fights, wins, ROUND(win_pct * 100, 1) AS win_pct FROM boxers_leaderboard ORDER BY boxers_leaderboard.{order_by} DESC"
+    ), f"Unexpected leaderboard query: {actual_query}"
+    assert mock_cursor.row_factory is sqlite3.Row
+
+    assert leaderboard == [ali]
+
+
+def test_get_leaderboard_win_pct_precision(db):
+    """Test that win percentages are ordered by their stored value, not the rounded one shown.
+
+    """
+    db.executescript("""
+        INSERT INTO boxers_leaderboard (id, name, weight, height, reach, age, fights, wins, win_pct)
+        VALUES (1, 'Ali', 180, 70, 72.5, 28, 3, 2, 0.66666),
+               (2, 'Tyson', 220, 71, 71.0, 30, 3, 2, 0.6667);
+    """)
+
+    leaderboard = get_leaderboard("win_pct")
+
+    assert [row['name'] for row in leaderboard] == ["Tyson", "Ali"], f"Unexpected order: {leaderboard}"
+    assert [row['win_pct'] for row in leaderboard] == [66.7, 66.7]
+
+
+@pytest.mark.parametrize("sort_by, index", [
+    ("wins", "idx_boxers_leaderboard_wins"),
+    ("win_pct", "idx_boxers_leaderboard_win_pct"),
+])
+def test_get_leaderboard_uses_index(memory_db, sort_by, index):
+    """Test that each leaderboard order walks its index instead of sorting.
+
+    """
+    plan = " ".join(row[3] for row in memory_db.execute(f"EXPLAIN QUERY PLAN {_LEADERBOARD_QUERIES[sort_by]}"))
+
+    assert f"USING INDEX {index}" in plan, f"Unexpected query plan: {plan}"
+    assert "TEMP B-TREE" not in plan, f"Expected no separate sort step: {plan}"
+
+
+def test_get_leaderboard_invalid_sort():
+    """Test that an unknown sort field is rejected.
+
+    """
+    with pytest.raises(ValueError, match="Invalid sort_by parameter: age"):
+        get_leaderboard("age")
+
+
+######################################################
+#
+#    Fight stats
+#
+######################################################
+
+
+@pytest.mark.parametrize("result, expected_wins", [("win", 1), ("loss", 0)])
+@pytest.mark.parametrize("exists, raises", [(True, None), (False, "Boxer with ID 1 not found.")])
+def test_update_boxer_stats(db, result, expected_wins, exists, raises):
+    """Test that recording a result updates the boxer and refreshes their leaderboard row,
+    or leaves the leaderboard untouched when the boxer does not exist.
+
+    """
+    if exists:
+        create_boxer(name="Ali", weight=180, height=70, reach=72.5, age=28)
+
+    if raises:
+        with pytest.raises(ValueError, match=raises):
+            update_boxer_stats(1, result)
+
+        assert not db.in_transaction, "Expected the failed update to be rolled back"
+        assert db.execute("SELECT COUNT(*) FROM boxers_leaderboard").fetchone()[0] == 0, \
+            "Expected no leaderboard row for a missing boxer."
+        return
+
+    update_boxer_stats(1, result)
+
+    stats = db.execute("SELECT fights, wins FROM boxers WHERE id = 1").fetchone()
+    assert stats == (1, expected_wins), f"Unexpected stats after a {result}: {stats}"
+
+    leaderboard = db.execute("SELECT id, fights, wins, win_pct FROM boxers_leaderboard").fetchall()
+    assert leaderboard == [(1, 1, expected_wins, float(expected_wins))], f"Unexpected leaderboard: {leaderboard}"
+
+
+def test_update_boxer_stats_invalid_result():
+    """Test that an unknown fight result is rejected.
+
+    """
+    with pytest.raises(ValueError, match="Invalid result: draw. Expected 'win' or 'loss'."):
+        update_boxer_stats(1, "draw")
+
+
+def test_update_boxer_stats_pair(db):
+    """Test that both results of a fight are recorded and committed together.
+
+    """
+    create_boxer(name="Ali", weight=180, height=70, reach=72.5, age=28)
+    create_boxer(name="Tyson", weight=220, height=71, reach=71.0, age=30)
+
+    update_boxer_stats_pair(1, 2)
+
+    assert not db.in_transaction, "Expected the fight to be committed"
+    leaderboard = get_leaderboard("win_pct")
+    assert [(row['name'], row['fights'], row['wins'], row['win_pct']) for row in leaderboard] == [
+        ("Ali", 1, 1, 100.0),
+        ("Tyson", 1, 0, 0.0),
+    ], f"Unexpected leaderboard: {leaderboard}"
+
+
+def test_update_boxer_stats_pair_not_found(db):
+    """Test that a missing boxer aborts the fight before anything is committed.
+
+    """
+    create_boxer(name="Ali", weight=180, height=70, reach=72.5, age=28)
+
+    with pytest.raises(ValueError, match="Boxer with ID 2 not found."):
+        update_boxer_stats_pair(1, 2)
+
+    assert not db.in_transaction, "Expected the winner's update to be rolled back"
+    assert db.execute("SELECT fights, wins FROM boxers WHERE id = 1").fetchone() == (0, 0)
+    assert db.execute("SELECT COUNT(*) FROM boxers_leaderboard").fetchone()[0] == 0
@@ -0,0 +1,33 @@
+import logging
+
+from flask import Flask
+
+from boxing.utils.logger import configure_logger
+
+
+def test_configure_logger_adds_one_handler():
+    """Test that configuring a logger repeatedly does not stack handlers.
+
+    """
+    logger = logging.getLogger("tests.configure_logger.repeat")
+
+    configure_logger(logger)
+    configure_logger(logger)
+
+    assert len(logger.handlers) == 1, f"Expected a single handler, got {logger.handlers}"
+    assert logger.level == logging.DEBUG
+
+
+def test_configure_logger_in_request_context():
+    """Test that Flask's handlers are only attached once across requests.
+
+    """
+    app = Flask(__name__)
+    logger = logging.getLogger("tests.configure_logger.request")
+
+    for _ in range(3):
+        with app.test_request_context():
+            configure_logger(logger)
+
+    expected = 1 + len(app.logger.handlers)
+    assert len(logger.handlers) == expected, f"Expected {expected} handlers, got {logger.handlers}"
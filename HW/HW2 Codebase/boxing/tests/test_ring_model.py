@@ -0,0 +1,149 @@
+import math
+
+import pytest
+
+from boxing.models.boxers_model import Boxer
+from boxing.models.ring_model import RingModel
+
+
+@pytest.fixture(scope="module")
+def shared_ring_model():
+    """Single RingModel instance reused by every test in the module."""
+    return RingModel()
+
+@pytest.fixture()
+def ring_model(shared_ring_model):
+    """Fixture to provide an empty RingModel, cleared again after each test."""
+    yield shared_ring_model
+    # Also covers tests that stop midway, e.g. after the ring is full
+    shared_ring_model.clear_ring()
+
+@pytest.fixture
+def mock_fight(mocker):
+    """Mock the random number and stats update a fight depends on, in a single patcher."""
+    return mocker.patch.multiple(
+        "boxing.models.ring_model", get_random=mocker.DEFAULT, update_boxer_stats_pair=mocker.DEFAULT
+    )
+
+@pytest.fixture(scope="session")
+def boxer_factory():
+    """Factory returning shared boxers, each built once per test session.
+
+    Boxers are frozen, so tests can safely reuse the same instance.
+
+    """
+    cache = {}
+
+    def make_boxer(boxer_id, name, weight=180, height=70, reach=72.5, age=28):
+        key = (boxer_id, name, weight, height, reach, age)
+        if key not in cache:
+            cache[key] = Boxer(*key)
+        return cache[key]
+
+    return make_boxer
+
+"""Fixtures providing sample boxers for the tests."""
+@pytest.fixture(scope="session")
+def sample_boxer1(boxer_factory):
+    return boxer_factory(1, 'Ali')
+
+@pytest.fixture(scope="session")
+def sample_boxer2(boxer_factory):
+    return boxer_factory(2, 'Tyson', weight=220, height=71, reach=71.0, age=30)
+
+
+##################################################
+# Ring Management Test Cases
+##################################################
+
+
+def test_enter_ring_invalid_type(ring_model, sample_boxer1):
+    """Test error when entering something that is not a Boxer.
+
+    """
+    with pytest.raises(TypeError, match="Invalid type: Expected 'Boxer', got 'dict'"):
+        ring_model.enter_ring({"name": "Ali"})
+
+
+@pytest.mark.parametrize("action", ["none", "clear", "enter_third"])
+def test_ring_state(ring_model, boxer_factory, sample_boxer1, sample_boxer2, action):
+    """Test the ring after two boxers enter: it holds both, can be cleared, and rejects a third.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    if action == "none":
+        assert ring_model.get_boxers() == [sample_boxer1, sample_boxer2]
+    elif action == "clear":
+        ring_model.clear_ring()
+        assert len(ring_model.get_boxers()) == 0, "Ring should be empty after clearing"
+    else:
+        with pytest.raises(ValueError, match="Ring is full, cannot add more boxers."):
+            ring_model.enter_ring(boxer_factory(3, 'Rocky'))
+        assert ring_model.get_boxers() == [sample_boxer1, sample_boxer2], "A full ring should keep its boxers"
+
+
+##################################################
+# Fight Test Cases
+##################################################
+
+
+def test_get_fighting_skill(ring_model, sample_boxer1):
+    """Test the fighting skill calculation.
+
+    """
+    # 180 * len('Ali') + 72.5 / 10 + 0 age modifier
+    assert ring_model.get_fighting_skill(sample_boxer1) == pytest.approx(547.25)
+
+
+@pytest.mark.parametrize("age, modifier", [(18, -1), (24, -1), (25, 0), (35, 0), (36, -2), (40, -2)])
+def test_get_fighting_skill_age_modifier(ring_model, boxer_factory, age, modifier):
+    """Test the age modifier at each boundary.
+
+    """
+    boxer = boxer_factory(1, 'Ali', age=age)
+
+    assert ring_model.get_fighting_skill(boxer) == pytest.approx(547.25 + modifier)
+
+
+def test_fight_not_enough_boxers(ring_model, sample_boxer1):
+    """Test error when fighting with fewer than two boxers.
+
+    """
+    ring_model.enter_ring(sample_boxer1)
+
+    with pytest.raises(ValueError, match="There must be two boxers to start a fight."):
+        ring_model.fight()
+
+
+@pytest.mark.parametrize("random_number, expected_winner", [(0.5, "Ali"), (1.0, "Tyson")])
+def test_fight(ring_model, sample_boxer1, sample_boxer2, mock_fight, random_number, expected_winner):
+    """Test that the logistic skill gap decides the winner and stats are recorded.
+
+    """
+    mock_fight["get_random"].return_value = random_number
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(sample_boxer2)
+
+    winner = ring_model.fight()
+
+    assert winner == expected_winner
+    winner_id, loser_id = (1, 2) if expected_winner == "Ali" else (2, 1)
+    mock_fight["update_boxer_stats_pair"].assert_called_once_with(winner_id, loser_id)
+    assert ring_model.get_boxers() == [], "Ring should be cleared after a fight"
+
+
+@pytest.mark.parametrize("offset, expected_winner", [(-0.01, "Ali"), (0.01, "Bob")])
+def test_fight_close_skills(ring_model, boxer_factory, sample_boxer1, mock_fight, offset, expected_winner):
+    """Test that boxer 1 wins only when the random number is below the logistic of the skill gap.
+
+    """
+    # Same weight and name length as Ali, slightly shorter reach: a skill gap of 0.25
+    close_boxer = boxer_factory(2, 'Bob', reach=70.0)
+    threshold = 1 / (1 + math.e ** -0.25)
+    mock_fight["get_random"].return_value = threshold + offset
+    ring_model.enter_ring(sample_boxer1)
+    ring_model.enter_ring(close_boxer)
+
+    assert ring_model.fight() == expected_winner
@@ -0,0 +1,367 @@
+from contextlib import ExitStack
+from pathlib import Path
+import re
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from boxing.utils import sql_utils
+from boxing.utils.sql_utils import (
+    check_database_connection,
+    check_table_exists,
+    close_all,
+    get_db_connection
+)
+
+
+######################################################
+#
+#    Fixtures
+#
+######################################################
+
+
+class _StubCursor:
+    """Cursor double that records executed statements and returns a scripted row."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.fetch = None
+        self.executed = []
+
+    def execute(self, *args):
+        self.executed.append(args)
+
+    def fetchone(self):
+        return self.fetch
+
+class _StubConnection:
+    """Connection double handing out a single cursor and counting closes."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.reset()
+
+    def reset(self):
+        self.close_calls = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def close(self):
+        self.close_calls += 1
+
+@pytest.fixture(scope="module")
+def stub_sqlite_pair():
+    """Connection and cursor stubs built once for the module."""
+    stub_cursor = _StubCursor()
+    return _StubConnection(stub_cursor), stub_cursor
+
+@pytest.fixture
+def mock_sqlite_connection(mocker, stub_sqlite_pair):
+    # The checks only call execute, fetchone and close, so plain stubs stand in for Mocks
+    stub_conn, stub_cursor = stub_sqlite_pair
+    stub_conn.reset()
+    stub_cursor.reset()
+    connect = mocker.patch("sqlite3.connect", return_value=stub_conn)
+
+    # Failure tests set connect.side_effect rather than patching sqlite3.connect again
+    return SimpleNamespace(conn=stub_conn, cursor=stub_cursor, connect=connect)
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point sql_utils at a fresh on-disk database and close its pool afterwards."""
+    path = str(tmp_path / "boxing.db")
+    monkeypatch.setattr(sql_utils, "DB_PATH", path)
+    yield path
+    close_all()
+
+
+######################################################
+#
+#    Health checks
+#
+######################################################
+
+
+def test_check_database_connection(mock_sqlite_connection):
+    """Test that a working connection passes the health check.
+
+    """
+    check_database_connection()
+
+    assert mock_sqlite_connection.cursor.executed == [("SELECT 1;",)]
+    assert mock_sqlite_connection.conn.close_calls == 1, "Expected the connection to be closed"
+
+
+@pytest.mark.parametrize("fetch, raises", [(("boxers",), None), (None, "Table 'boxers' does not exist.")])
+def test_check_table_exists(mock_sqlite_connection, fetch, raises):
+    """Test that an existing table passes the check and a missing one raises an error.
+
+    """
+    stub_cursor = mock_sqlite_connection.cursor
+    stub_cursor.fetch = fetch
+
+    if raises:
+        with pytest.raises(Exception, match=raises):
+            check_table_exists("boxers")
+    else:
+        check_table_exists("boxers")
+
+    assert stub_cursor.executed == [
+        ("SELECT name FROM sqlite_master WHERE type='table' AND name=?;", ("boxers",))
+    ]
+
+
+@pytest.mark.parametrize("check, match", [
+    (check_database_connection, "Database connection error: Connection failed"),
+    (lambda: check_table_exists("boxers"), "Table check error for 'boxers': Connection failed"),
+], ids=["database_connection", "table_exists"])
+def test_check_error(mock_sqlite_connection, check, match):
+    """Test that connection errors from either check are wrapped in a generic exception.
+
+    """
+    mock_sqlite_connection.connect.side_effect = sqlite3.Error("Connection failed")
+
+    with pytest.raises(Exception, match=match):
+        check()
+
+
+######################################################
+#
+#    Connections
+#
+######################################################
+
+
+def test_get_db_connection_pragmas(db_path):
+    """Test that pooled connections run in WAL mode with the tuned pragmas.
+
+    """
+    with get_db_connection() as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+        cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+
+    assert journal_mode == "wal", f"Expected WAL journal mode, got {journal_mode}"
+    assert synchronous == 1, f"Expected synchronous=NORMAL (1), got {synchronous}"
+    assert temp_store == 2, f"Expected temp_store=MEMORY (2), got {temp_store}"
+    assert cache_size == -20000, f"Expected cache_size=-20000, got {cache_size}"
+
+
+def test_get_db_connection_statement_cache(db_path, mocker):
+    """Test that pooled connections are opened with an enlarged statement cache.
+
+    """
+    connect = mocker.patch("sqlite3.connect", wraps=sqlite3.connect)
+
+    with get_db_connection():
+        pass
+
+    # One writer plus the readers, all opened by the first get_db_connection call
+    assert connect.call_count == 1 + sql_utils.DB_POOL_SIZE, f"Unexpected connect calls: {connect.call_args_list}"
+    for call in connect.call_args_list:
+        assert call.kwargs["cached_statements"] == 256, f"Unexpected connect call: {call}"
+
+
+def test_get_db_connection_reuses_connections(db_path):
+    """Test that connections are returned to the pool instead of being closed.
+
+    """
+    with get_db_connection() as first:
+        pass
+    with get_db_connection() as second:
+        pass
+
+    assert first is second, "Expected the writer connection to be reused"
+
+    with get_db_connection(readonly=True) as reader:
+        assert reader is not first, "Expected readers to be separate from the writer"
+
+
+def test_get_db_connection_pool_exhausted(db_path, monkeypatch):
+    """Test that waiting too long for a reader raises a database error.
+
+    """
+    monkeypatch.setattr(sql_utils, "DB_TIMEOUT", 0.01)
+
+    with ExitStack() as stack:
+        for _ in range(sql_utils.DB_POOL_SIZE):
+            stack.enter_context(get_db_connection(readonly=True))
+
+        with pytest.raises(sqlite3.OperationalError, match="Timed out waiting for a database connection"):
+            with get_db_connection(readonly=True):
+                pass
+
+
+def test_get_db_connection_discards_uncommitted(db_path):
+    """Test that uncommitted work is rolled back before a connection is reused.
+
+    """
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE boxers (id INTEGER PRIMARY KEY)")
+        conn.commit()
+        conn.execute("INSERT INTO boxers (id) VALUES (1)")
+
+    with get_db_connection(readonly=True) as conn:
+        count = conn.execute("SELECT COUNT(*) FROM boxers").fetchone()[0]
+
+    assert count == 0, f"Expected uncommitted insert to be discarded, found {count} rows"
+
+
+def test_get_db_connection_replaces_broken_writer(db_path, mocker, monkeypatch):
+    """Test that a writer that can't be reset is replaced and the write lock is released.
+
+    """
+    monkeypatch.setattr(sql_utils, "DB_TIMEOUT", 0.01)
+
+    with get_db_connection() as conn:
+        conn.close()  # The rollback on release now fails
+        # ...and so does reopening the database, until the next checkout
+        connect = mocker.patch("boxing.utils.sql_utils._connect", side_effect=sqlite3.OperationalError("disk I/O error"))
+    mocker.stop(connect)
+
+    with get_db_connection() as new_conn:
+        assert new_conn is not conn, "Expected a fresh writer connection"
+        assert new_conn.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_get_db_connection_replaces_broken_reader(db_path, monkeypatch):
+    """Test that a reader that can't be reset keeps its slot in the pool.
+
+    """
+    monkeypatch.setattr(sql_utils, "DB_TIMEOUT", 0.01)
+
+    with get_db_connection(readonly=True) as conn:
+        conn.close()  # The rollback on release now fails
+
+    # Every slot can still be checked out, and the emptied one is reconnected
+    with ExitStack() as stack:
+        readers = [stack.enter_context(get_db_connection(readonly=True)) for _ in range(sql_utils.DB_POOL_SIZE)]
+
+        assert conn not in readers, "Expected the broken reader to be replaced"
+        for reader in readers:
+            assert reader.execute("SELECT 1").fetchone() == (1,)
+
+
+def test_connection_pool_closes_on_failure(db_path, mocker):
+    """Test that connections opened before a pool fails to build are closed.
+
+    """
+    opened = []
+
+    def connect(path):
+        if len(opened) == 2:
+            raise sqlite3.OperationalError("unable to open database file")
+        opened.append(sqlite3.connect(path))
+        return opened[-1]
+
+    mocker.patch("boxing.utils.sql_utils._connect", side_effect=connect)
+
+    with pytest.raises(sqlite3.OperationalError, match="unable to open database file"):
+        with get_db_connection():
+            pass
+
+    assert len(opened) == 2, "Expected the writer and one reader to be opened"
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_close_all(db_path):
+    """Test that close_all closes pooled connections and a new pool is opened on demand.
+
+    """
+    with get_db_connection() as conn:
+        pass
+
+    close_all()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+    with get_db_connection() as new_conn:
+        assert new_conn is not conn
+
+
+def test_get_db_connection_bootstraps_schema(db_path):
+    """Test that a database from before the leaderboard table gets it, its indexes and backfilled rows.
+
+    """
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE boxers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            weight REAL NOT NULL,
+            height REAL NOT NULL,
+            reach REAL,
+            age INTEGER NOT NULL,
+            fights INTEGER DEFAULT 0,
+            wins INTEGER DEFAULT 0
+        );
+        INSERT INTO boxers (name, weight, height, reach, age, fights, wins) VALUES ('Ali', 180, 70, 72.5, 28, 4, 3);
+        INSERT INTO boxers (name, weight, height, reach, age) VALUES ('Tyson', 220, 71, 71.0, 30);
+    """)
+    conn.close()
+
+    with get_db_connection(readonly=True) as conn:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        leaderboard = conn.execute("SELECT name, fights, wins, win_pct FROM boxers_leaderboard").fetchall()
+
+    assert {"idx_boxers_name", "idx_boxers_leaderboard_wins", "idx_boxers_leaderboard_win_pct"} <= indexes
+    assert leaderboard == [("Ali", 4, 3, 0.75)], f"Expected only boxers who have fought, got {leaderboard}"
+
+
+def test_bootstrap_schema_matches_init_db():
+    """Test that the bootstrapped leaderboard schema is the one init_db.sql creates.
+
+    """
+    schema_objects = ("idx_boxers_name", "boxers_leaderboard",
+                      "idx_boxers_leaderboard_wins", "idx_boxers_leaderboard_win_pct")
+
+    def schema(conn):
+        rows = conn.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE name IN ({', '.join('?' * len(schema_objects))})",
+            schema_objects
+        )
+        return {name: re.sub(r'\s+', ' ', sql).replace("( ", "(").replace(" )", ")").strip() for name, sql in rows}
+
+    init_db = sqlite3.connect(":memory:")
+    init_db.executescript((Path(__file__).resolve().parents[1] / "sql" / "init_db.sql").read_text())
+
+    bootstrapped = sqlite3.connect(":memory:")
+    bootstrapped.execute("""
+        CREATE TABLE boxers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            weight REAL NOT NULL,
+            height REAL NOT NULL,
+            reach REAL,
+            age INTEGER NOT NULL,
+            fights INTEGER DEFAULT 0,
+            wins INTEGER DEFAULT 0
+        )
+    """)
+    sql_utils._bootstrap_schema(bootstrapped)
+
+    expected, actual = schema(init_db), schema(bootstrapped)
+    init_db.close()
+    bootstrapped.close()
+
+    assert set(expected) == set(schema_objects), f"init_db.sql is missing schema objects: {expected}"
+    assert actual == expected, "Schema bootstrap has drifted from init_db.sql"
+
+
+def test_get_db_connection_skips_bootstrap_without_boxers(db_path):
+    """Test that an uninitialized database is left alone.
+
+    """
+    with get_db_connection(readonly=True) as conn:
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+
+    assert tables == [], f"Expected no tables to be created, got {tables}"